@@ -12,6 +12,15 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str = "minioadmin"
     MINIO_BUCKET: str = "html-files"
     MINIO_SECURE: bool = False
+    MINIO_MAX_POOL_CONNECTIONS: int = 10
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+
+    WARMUP_CONNECTIONS: int = 2
+    WARMUP_TIMEOUT_SECONDS: float = 15.0
+    READINESS_CHECK_INTERVAL_SECONDS: float = 10.0
+    READINESS_CHECK_TIMEOUT_SECONDS: float = 3.0
     
     class Config:
         env_file = ".env"
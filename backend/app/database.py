@@ -1,9 +1,15 @@
-from sqlalchemy import create_engine
+import math
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -14,3 +20,33 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# Readiness probes use their own unpooled connections so a saturated request
+# pool can't make a healthy database look down. libpq only accepts whole
+# seconds for connect_timeout, with a minimum of 2.
+_probe_timeout = settings.READINESS_CHECK_TIMEOUT_SECONDS
+probe_engine = create_engine(
+    settings.DATABASE_URL,
+    poolclass=NullPool,
+    connect_args={
+        "connect_timeout": max(2, math.ceil(_probe_timeout)),
+        "options": f"-c statement_timeout={int(_probe_timeout * 1000)}",
+    },
+)
+
+def check_database():
+    with probe_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+def warm_up_pool(connections: int = settings.WARMUP_CONNECTIONS):
+    # Check out several connections at once so the pool keeps them open
+    # instead of handing the same single connection back each time
+    opened = []
+    try:
+        for _ in range(min(connections, settings.DB_POOL_SIZE)):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from app.config import settings
+from app import database, s3_client
+
+logger = logging.getLogger(__name__)
+
+CHECKS: Dict[str, Callable[[], None]] = {
+    "database": database.check_database,
+    "storage": s3_client.check_bucket,
+}
+
+# Latest result per dependency, refreshed in the background so /readyz
+# never waits on Postgres or MinIO itself
+_results: Dict[str, dict] = {}
+_bucket_ready = False
+_warmed_up = False
+_warm_up_future: Optional[asyncio.Future] = None
+
+async def _run_check(name: str, check: Callable[[], None]) -> dict:
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(
+            asyncio.to_thread(check),
+            timeout=settings.READINESS_CHECK_TIMEOUT_SECONDS,
+        )
+        error = None
+    except asyncio.TimeoutError:
+        error = "timed out"
+    except Exception as e:
+        error = str(e)
+    latency_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    if error:
+        logger.warning(f"Readiness check '{name}' failed: {error}")
+    return {
+        "ok": error is None,
+        "latency_ms": latency_ms,
+        "checked_at": datetime.utcnow().isoformat(),
+        "monotonic": time.monotonic(),
+        "error": error,
+    }
+
+async def refresh_checks():
+    results = await asyncio.gather(
+        *(_run_check(name, check) for name, check in CHECKS.items())
+    )
+    _results.update(zip(CHECKS.keys(), results))
+
+async def ensure_bucket():
+    global _bucket_ready
+    try:
+        await asyncio.wait_for(
+            asyncio.to_thread(s3_client.ensure_bucket_exists),
+            timeout=settings.WARMUP_TIMEOUT_SECONDS,
+        )
+        _bucket_ready = True
+    except asyncio.TimeoutError:
+        logger.error("Bucket check timed out, will retry")
+    except Exception as e:
+        logger.error(f"Bucket check failed, will retry: {str(e)}")
+
+def _warm_up_pools():
+    database.warm_up_pool()
+    s3_client.warm_up_pool()
+
+async def warm_up():
+    global _warmed_up, _warm_up_future
+    # wait_for can't stop the worker thread, so a timed-out attempt is left
+    # running and awaited again next round instead of starting a second one
+    future = _warm_up_future
+    if future is None or (future.done() and future.exception() is not None):
+        future = asyncio.get_running_loop().run_in_executor(None, _warm_up_pools)
+        _warm_up_future = future
+    try:
+        await asyncio.wait_for(
+            asyncio.shield(future),
+            timeout=settings.WARMUP_TIMEOUT_SECONDS,
+        )
+        _warmed_up = True
+        logger.info("Database and storage connection pools warmed up")
+    except asyncio.TimeoutError:
+        logger.error("Warm-up still running, will check again")
+    except Exception as e:
+        logger.error(f"Warm-up failed, will retry: {str(e)}")
+
+async def run_checks_once():
+    # The storage check can only pass once the bucket exists, so creating it
+    # can't wait behind the all-checks-passing gate below
+    if not _bucket_ready:
+        await ensure_bucket()
+    await refresh_checks()
+    # Warm-up goes through the request pools, which have no short client
+    # timeouts, so only attempt it once the probes show both dependencies
+    # are answering
+    if not _warmed_up and all(result["ok"] for result in _results.values()):
+        await warm_up()
+
+async def run_background_checks():
+    while True:
+        await run_checks_once()
+        await asyncio.sleep(settings.READINESS_CHECK_INTERVAL_SECONDS)
+
+def readiness_report() -> dict:
+    # A result older than a few intervals means the refresher has stalled
+    max_age = settings.READINESS_CHECK_INTERVAL_SECONDS * 3 + settings.READINESS_CHECK_TIMEOUT_SECONDS
+    now = time.monotonic()
+
+    checks = {}
+    ready = _warmed_up
+    for name in CHECKS:
+        result = _results.get(name)
+        if result is None:
+            checks[name] = {"ok": False, "latency_ms": None, "checked_at": None, "error": "not checked yet"}
+            ready = False
+            continue
+        stale = now - result["monotonic"] > max_age
+        ok = result["ok"] and not stale
+        checks[name] = {
+            "ok": ok,
+            "latency_ms": result["latency_ms"],
+            "checked_at": result["checked_at"],
+            "error": "stale result" if stale and result["ok"] else result["error"],
+        }
+        ready = ready and ok
+
+    return {
+        "status": "ready" if ready else "not ready",
+        "warmed_up": _warmed_up,
+        "checks": checks,
+    }
@@ -1,10 +1,11 @@
 from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Form
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, HTMLResponse
+from fastapi.responses import StreamingResponse, HTMLResponse, JSONResponse
 from sqlalchemy.orm import Session
 from datetime import timedelta, datetime
 from typing import List, Optional
+import asyncio
 import uuid
 import io
 import secrets
@@ -12,8 +13,8 @@ import bcrypt
 
 from app.config import settings
 from app.database import get_db
-from app import models, schemas, auth
-from app.s3_client import get_s3_client, ensure_bucket_exists
+from app import models, schemas, auth, health
+from app.s3_client import get_s3_client
 
 app = FastAPI(title="File Uploader API")
 
@@ -28,7 +29,20 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def startup_event():
-    ensure_bucket_exists()
+    # Bucket check and pool warm-up run in worker threads in the background;
+    # /readyz stays 503 until they have succeeded
+    app.state.health_task = asyncio.create_task(health.run_background_checks())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    health_task = getattr(app.state, "health_task", None)
+    if health_task is None:
+        return
+    health_task.cancel()
+    try:
+        await health_task
+    except asyncio.CancelledError:
+        pass
 
 @app.post("/api/auth/register", response_model=schemas.UserResponse)
 def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
@@ -412,3 +426,13 @@ def access_shared_file(
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+@app.get("/livez")
+def liveness_check():
+    return {"status": "alive"}
+
+@app.get("/readyz")
+def readiness_check():
+    report = health.readiness_report()
+    status_code = 200 if report["status"] == "ready" else 503
+    return JSONResponse(content=report, status_code=status_code)
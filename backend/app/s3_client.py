@@ -1,20 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import boto3
 from botocore.client import Config
+from botocore.exceptions import ClientError
 from app.config import settings
 
-def get_s3_client():
+def _create_client(config: Config):
     return boto3.client(
         's3',
         endpoint_url=f"http://{settings.MINIO_ENDPOINT}",
         aws_access_key_id=settings.MINIO_ACCESS_KEY,
         aws_secret_access_key=settings.MINIO_SECRET_KEY,
-        config=Config(signature_version='s3v4'),
+        config=config,
         region_name='us-east-1'
     )
 
+@lru_cache(maxsize=None)
+def get_s3_client():
+    # boto3 clients are thread-safe; sharing one keeps its connection pool warm
+    return _create_client(Config(
+        signature_version='s3v4',
+        max_pool_connections=settings.MINIO_MAX_POOL_CONNECTIONS,
+    ))
+
+@lru_cache(maxsize=None)
+def get_probe_client():
+    # Fails fast instead of botocore's 60 s connect timeout plus retries, so
+    # probe threads finish around the time readiness stops waiting for them
+    return _create_client(Config(
+        signature_version='s3v4',
+        connect_timeout=settings.READINESS_CHECK_TIMEOUT_SECONDS,
+        read_timeout=settings.READINESS_CHECK_TIMEOUT_SECONDS,
+        retries={'max_attempts': 1},
+    ))
+
 def ensure_bucket_exists():
-    s3_client = get_s3_client()
+    s3_client = get_probe_client()
     try:
         s3_client.head_bucket(Bucket=settings.MINIO_BUCKET)
-    except:
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchBucket', 'NotFound'):
+            raise
         s3_client.create_bucket(Bucket=settings.MINIO_BUCKET)
+
+def check_bucket():
+    get_probe_client().head_bucket(Bucket=settings.MINIO_BUCKET)
+
+def warm_up_pool(connections: int = settings.WARMUP_CONNECTIONS):
+    # Concurrent requests force the client to open that many pooled connections
+    connections = min(connections, settings.MINIO_MAX_POOL_CONNECTIONS)
+    if connections < 1:
+        return
+    s3_client = get_s3_client()
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        futures = [
+            executor.submit(s3_client.head_bucket, Bucket=settings.MINIO_BUCKET)
+            for _ in range(connections)
+        ]
+        for future in futures:
+            future.result()
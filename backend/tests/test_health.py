@@ -0,0 +1,118 @@
+import asyncio
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app import health, s3_client
+from app.config import settings
+
+
+class FakeProbeClient:
+    def __init__(self, bucket_exists=False):
+        self.bucket_exists = bucket_exists
+        self.created = []
+
+    def head_bucket(self, Bucket):
+        if not self.bucket_exists:
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadBucket")
+
+    def create_bucket(self, Bucket):
+        self.created.append(Bucket)
+        self.bucket_exists = True
+
+
+@pytest.fixture(autouse=True)
+def reset_health_state(monkeypatch):
+    monkeypatch.setattr(health, "_results", {})
+    monkeypatch.setattr(health, "_bucket_ready", False)
+    monkeypatch.setattr(health, "_warmed_up", False)
+    monkeypatch.setattr(health, "_warm_up_future", None)
+    monkeypatch.setitem(health.CHECKS, "database", lambda: None)
+    monkeypatch.setattr(health.database, "warm_up_pool", lambda: None)
+    monkeypatch.setattr(health.s3_client, "warm_up_pool", lambda: None)
+
+
+def _passing_result(age_seconds=0.0):
+    return {
+        "ok": True,
+        "latency_ms": 1.0,
+        "checked_at": "2026-01-01T00:00:00",
+        "monotonic": time.monotonic() - age_seconds,
+        "error": None,
+    }
+
+
+def test_missing_bucket_is_created_and_becomes_ready(monkeypatch):
+    client = FakeProbeClient(bucket_exists=False)
+    monkeypatch.setattr(s3_client, "get_probe_client", lambda: client)
+
+    asyncio.run(health.run_checks_once())
+
+    assert client.created == [settings.MINIO_BUCKET]
+    report = health.readiness_report()
+    assert report["status"] == "ready"
+    assert report["checks"]["storage"]["ok"]
+
+
+def test_bucket_check_error_is_not_treated_as_missing(monkeypatch):
+    client = FakeProbeClient()
+
+    def head_bucket(Bucket):
+        raise ClientError({"Error": {"Code": "503", "Message": "Slow Down"}}, "HeadBucket")
+
+    client.head_bucket = head_bucket
+    monkeypatch.setattr(s3_client, "get_probe_client", lambda: client)
+
+    with pytest.raises(ClientError):
+        s3_client.ensure_bucket_exists()
+    assert client.created == []
+
+
+def test_not_ready_until_warmed_up(monkeypatch):
+    monkeypatch.setattr(health, "_results", {name: _passing_result() for name in health.CHECKS})
+
+    report = health.readiness_report()
+
+    assert report["status"] == "not ready"
+    assert report["warmed_up"] is False
+    assert all(check["ok"] for check in report["checks"].values())
+
+
+def test_stale_results_are_not_ready(monkeypatch):
+    max_age = settings.READINESS_CHECK_INTERVAL_SECONDS * 3 + settings.READINESS_CHECK_TIMEOUT_SECONDS
+    monkeypatch.setattr(health, "_warmed_up", True)
+    monkeypatch.setattr(health, "_results", {
+        "database": _passing_result(),
+        "storage": _passing_result(age_seconds=max_age + 1),
+    })
+
+    report = health.readiness_report()
+
+    assert report["status"] == "not ready"
+    assert report["checks"]["database"]["ok"]
+    assert not report["checks"]["storage"]["ok"]
+    assert report["checks"]["storage"]["error"] == "stale result"
+
+
+def test_warm_up_is_not_restarted_while_running(monkeypatch):
+    monkeypatch.setattr(settings, "WARMUP_TIMEOUT_SECONDS", 0.05)
+    started = []
+
+    def slow_warm_up():
+        started.append(True)
+        time.sleep(0.2)
+
+    monkeypatch.setattr(health, "_warm_up_pools", slow_warm_up)
+
+    async def run():
+        await health.warm_up()
+        await health.warm_up()
+        assert not health._warmed_up
+        await asyncio.sleep(0.2)
+        await health.warm_up()
+
+    asyncio.run(run())
+
+    assert len(started) == 1
+    assert health._warmed_up